@@ -722,6 +722,86 @@ def propagate_status_change(words_data, target_id, new_status):
         
     return updates
 
+def propagate_status_changes(words_data, target_ids, new_status):
+    """
+    propagate_status_change for several words at once (e.g. a drag sweep).
+    Returns one (word_id, final_status) per affected word, in first-seen order.
+    """
+    merged = {}
+    for target_id in target_ids:
+        for wid, status in propagate_status_change(words_data, target_id, new_status):
+            merged[wid] = status
+    return list(merged.items())
+
+class RenderToken:
+    """
+    One visible entry of the transcript view. Slotted, because the renderer reads
+    several fields per word and attribute access is cheaper than dict.get.
+    `word` is the source dict from words_data, which stays the owner of status/selected;
+    `state` (effective status tag or None) and `state_next` (the following token has a
+    state) are derived from it by refresh_render_states.
+    """
+    __slots__ = ('id', 'text', 'is_inaudible', 'is_segment_start', 'seg_start', 'seg_end', 'word',
+                 'state', 'state_next')
+
+    def __init__(self, w):
+        self.id = w['id']
+        self.text = w.get('text', '')
+        self.is_inaudible = bool(w.get('is_inaudible'))
+        self.is_segment_start = bool(w.get('is_segment_start'))
+        self.seg_start = w.get('seg_start', 0)
+        self.seg_end = w.get('seg_end', 0)
+        self.word = w
+        self.state = None
+        self.state_next = False
+
+def refresh_render_states(plan, start=0):
+    """
+    (Re)computes the effective state of plan[start:] and the lookahead flag used
+    for the trailing space. A selected word without a status counts as 'bad' and
+    is stored as such; a selected inaudible counts as 'inaudible'.
+    """
+    prev = plan[start - 1] if start > 0 else None
+    for tok in plan[start:]:
+        w = tok.word
+        state = w.get('status')
+        if not state and w.get('selected'):
+            if tok.is_inaudible:
+                state = "inaudible"
+            else:
+                state = "bad"
+                w['status'] = "bad"
+        tok.state = state
+        tok.state_next = False
+        if prev is not None: prev.state_next = bool(state)
+        prev = tok
+
+def build_render_plan(words, show_inaudible=True):
+    """
+    Precomputes the visible word sequence for the transcript view, as RenderTokens.
+    Skips silence (and inaudible gaps when hidden) and collapses every run of
+    inaudible/silence entries into its first inaudible word, so the renderer
+    walks the result linearly and the next visible word is simply plan[j+1].
+    """
+    plan = []
+    in_inaudible_run = False
+    
+    for w in words:
+        if w.get('type') == 'silence':
+            continue
+        
+        if w.get('is_inaudible'):
+            if not show_inaudible or in_inaudible_run:
+                continue
+            in_inaudible_run = True
+        else:
+            in_inaudible_run = False
+        
+        plan.append(RenderToken(w))
+    
+    refresh_render_states(plan)
+    return plan
+
 def calculate_script_missing_ranges(text_content, missing_indices):
     """
     Maps missing word indices to character ranges in the raw script text.
@@ -25,23 +25,187 @@ import re
 import traceback
 import platform
 import random # Added for ID generation
+from bisect import bisect_left, bisect_right
+from collections import deque, namedtuple
+from operator import attrgetter
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 import config
 import algorythms
 from osdoc import log_info, log_error
 
+# Optional fast JSON parser; the stdlib parser is used when it isn't installed
+try:
+    import orjson
+    
+    def _json_loads(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity that json.dump (Whisper) may write
+            return json.loads(raw.decode('utf-8'))
+except ImportError:
+    def _json_loads(raw): return json.loads(raw.decode('utf-8'))
+
+# tqdm progress percentage, matched on raw stderr bytes (" 20%|██      | 100M/500M")
+_PCT_RE = re.compile(rb'(\d{1,3})%')
+
+# ffmpeg silencedetect markers; starts and ends alternate in the log
+_SIL_RE = re.compile(r'silence_(start|end): (\d+\.?\d*)')
+
+# EBU R128 loudness normalization ahead of silencedetect, resampled to 48 kHz mono
+# (the format the normalized intermediate wav used to be written in)
+_NORM_FILTER = "loudnorm=I=-23:LRA=7:tp=-2.0,aresample=48000,aformat=channel_layouts=mono"
+
+# One detected silence, in seconds (a tuple: ~half the size of an {'s', 'e'} dict)
+SilenceRange = namedtuple('SilenceRange', 's e')
+
+# Strips punctuation from Whisper word tokens
+_CLEAN_RE = re.compile(r"[^\w\s'-]")
+
+# Templates for the gap entries _build_data_structure inserts between words;
+# key order matches the word dicts so saved projects look the same
+_SIL_TMPL = {
+    "start": 0, "end": 0, "text": "[SILENCE]",
+    "type": "silence", "status": "silence", "selected": False,
+    "seg_start": 0, "seg_end": 0, "is_segment_start": False
+}
+_INAUD_TMPL = {
+    "start": 0, "end": 0, "text": "inaudible",
+    "type": "inaudible", "status": "inaudible", "selected": True, "is_inaudible": True,
+    "seg_start": 0, "seg_end": 0, "is_segment_start": False
+}
+
+# Whisper stderr hints that the GPU backend failed (-> retry on CPU)
+_GPU_FAIL_RE = re.compile(r'cuda|driver|gpu|kernel|torch|segmentation fault|code -11', re.IGNORECASE)
+
+# ==========================================
+# SILENCE OVERLAY (Timeline Phase 3)
+# ==========================================
+# Ops are (start_f, end_f, type) tuples in time order; s_ranges are disjoint
+# (start_f, end_f) silences in time order. Each silence can only cut into what
+# is left of an op after the previous one, and silences that ended before an op
+# starts are skipped with a cursor that only moves forward.
+
+def _overlay_silence_mark(ops, s_ranges, passthrough_types=frozenset()):
+    """Splits ops around silences, emitting the silent parts as 'silence_mark'."""
+    final_ops = []
+    sil_count = len(s_ranges)
+    cursor = 0
+    
+    for op in ops:
+        op_s, op_e, op_type = op
+        
+        if op_type in passthrough_types:
+            final_ops.append(op)
+            continue
+
+        while cursor < sil_count and s_ranges[cursor][1] <= op_s:
+            cursor += 1
+        
+        # Sweep the silences over the op once: pieces before each silence are
+        # final, only the remainder [pos, op_e] is still open to later ones
+        pos = op_s
+        rest_open = True
+        
+        k = cursor
+        while k < sil_count:
+            s_s, s_e = s_ranges[k]
+            # Case 1: Silence is outside (all later ones start even later)
+            if s_s >= op_e:
+                break
+            k += 1
+            if s_e <= pos:
+                continue
+            # Overlap: the silence is clamped to the open remainder, which
+            # also covers a silence spanning all of it (no part before/after)
+            # Part before silence
+            if s_s > pos:
+                final_ops.append((pos, s_s, op_type))
+            
+            # The silence part
+            final_ops.append((max(pos, s_s), min(op_e, s_e), 'silence_mark'))
+            
+            # Part after silence stays open
+            if s_e >= op_e:
+                rest_open = False
+                break
+            pos = s_e
+        
+        if rest_open:
+            # An op no silence touched goes out as the same tuple
+            final_ops.append(op if pos == op_s else (pos, op_e, op_type))
+    
+    return final_ops
+
+def _overlay_silence_cut(ops, s_ranges):
+    """Removes the silent parts of ops (cut only, nothing is marked)."""
+    final_ops = []
+    sil_count = len(s_ranges)
+    cursor = 0
+    
+    for op in ops:
+        op_s, op_e, op_type = op
+        
+        while cursor < sil_count and s_ranges[cursor][1] <= op_s:
+            cursor += 1
+        
+        pos = op_s
+        rest_open = True
+        
+        k = cursor
+        while k < sil_count:
+            s_s, s_e = s_ranges[k]
+            if s_s >= op_e:
+                break
+            k += 1
+            if s_e <= pos:
+                continue
+            # Part before silence
+            if s_s > pos:
+                final_ops.append((pos, s_s, op_type))
+            
+            # Part after silence stays open
+            if s_e >= op_e:
+                rest_open = False
+                break
+            pos = s_e
+        
+        if rest_open:
+            # An op no silence touched goes out as the same tuple
+            final_ops.append(op if pos == op_s else (pos, op_e, op_type))
+    
+    return final_ops
+
+# (mark, cut) -> splitter. Marking only keeps BAD (Red) and INAUDIBLE (Chocolate)
+# clips continuous over the silence (no holes punched); with neither there is no overlay.
+_SILENCE_OVERLAY = {
+    (True, True): _overlay_silence_mark,
+    (True, False): partial(_overlay_silence_mark, passthrough_types=frozenset(('bad', 'inaudible'))),
+    (False, True): _overlay_silence_cut,
+}
+
 class AudioEngine:
     def __init__(self, os_doctor, resolve_handler):
         self.os_doc = os_doctor
         self.resolve_handler = resolve_handler
         self.ffmpeg_cmd = self.os_doc.get_ffmpeg_cmd() or "ffmpeg"
+        self._whisper_exec = None # resolved once, see get_whisper_executable
+        self._whisper_env = None # built once, see get_whisper_env
 
     # ==========================================
     # 1. EXTERNAL PROCESS MANAGEMENT (WHISPER)
     # ==========================================
 
     def get_whisper_executable(self):
-        """Finds Whisper executable in the system."""
+        """
+        Finds Whisper executable in the system.
+        A found path is cached for the session.
+        """
+        if self._whisper_exec:
+            return self._whisper_exec
+        
         possible_paths = []
         
         if self.os_doc.is_win:
@@ -63,10 +227,31 @@ class AudioEngine:
         for path in possible_paths:
             if path and os.path.exists(path) and os.access(path, os.X_OK):
                 log_info(f"Found Whisper at: {path}")
+                self._whisper_exec = path
                 return path
         
         return "whisper" # Fallback to PATH command
 
+    def get_whisper_env(self):
+        """
+        Returns the environment Whisper subprocesses run with: the current one,
+        cleaned of variables that clash with the external Python, with ~/.local/bin
+        on PATH. Built on first use and reused (the dict is never mutated).
+        """
+        if self._whisper_env is None:
+            # Clean env to avoid conflicts
+            blocked = ("PYTHONHOME", "PYTHONPATH", "LD_LIBRARY_PATH", "LIBPATH", "LD_PRELOAD")
+            env = {k: v for k, v in os.environ.items() if k not in blocked}
+            
+            env["OMP_NUM_THREADS"] = "1"
+            local_bin = os.path.join(self.os_doc.home_dir, ".local", "bin")
+            env["PATH"] = f"{local_bin}{os.pathsep}{env.get('PATH', '')}"
+            
+            # NOTE: LD_LIBRARY_PATH injection removed to prevent Segfaults on Linux AMD.
+            # We rely on system/pipx paths and HSA_OVERRIDE from wrapper.
+            self._whisper_env = env
+        return self._whisper_env
+
     def _get_external_python_executable(self):
         """
         Locates the Python interpreter associated with the Whisper installation.
@@ -101,7 +286,15 @@ class AudioEngine:
         """
         Forces the download of a specific Whisper model by running a dummy python script.
         Uses external python to ensure access to the whisper library (pipx support).
+        Returns immediately if the model file is already in the Whisper cache.
         """
+        # Starting the external python (and importing torch) takes seconds,
+        # so a model that is already on disk is not verified that way
+        if self.check_model_exists(model_name):
+            log_info(f"Model {model_name} found in cache.")
+            if progress_callback: progress_callback(100)
+            return True
+        
         log_info(f"Starting interactive download for model: {model_name}")
         
         # Python script to trigger download via library
@@ -121,25 +314,33 @@ class AudioEngine:
                 cmd, 
                 stdout=subprocess.PIPE, 
                 stderr=subprocess.PIPE, 
-                text=True, 
-                startupinfo=startup_info,
-                env=os.environ.copy() # Pass current env
+                bufsize=0, # raw pipe: read() returns whatever tqdm has written so far
+                startupinfo=startup_info # current env is inherited
             )
             
-            # Whisper uses tqdm which prints to stderr
+            # Whisper uses tqdm which prints to stderr. Its updates are separated by
+            # '\r', so stderr is read in raw chunks (no line splitting, no decoding)
+            # and only the complete updates of each chunk are scanned.
+            pending = b""
+            last_val = -1
             while True:
-                line = process.stderr.readline()
-                if not line and process.poll() is not None:
+                chunk = process.stderr.read(4096)
+                if not chunk:
                     break
                 
-                if line:
-                    # Parse TQDM progress: " 20%|██      | 100M/500M"
-                    match = re.search(r'(\d+)%', line)
-                    if match and progress_callback:
-                        try:
-                            val = int(match.group(1))
-                            progress_callback(val)
-                        except: pass
+                data = pending + chunk
+                cut = max(data.rfind(b"\r"), data.rfind(b"\n")) + 1
+                complete, pending = data[:cut], data[cut:][-256:]
+                
+                if progress_callback and complete:
+                    matches = _PCT_RE.findall(complete)
+                    if matches:
+                        val = int(matches[-1])
+                        if val != last_val:
+                            last_val = val
+                            try: progress_callback(val)
+                            except: pass
+            process.wait()
             
             if process.returncode == 0:
                 log_info(f"Model {model_name} ready.")
@@ -196,17 +397,7 @@ class AudioEngine:
         whisper_exec = self.get_whisper_executable()
 
         # Environment configuration
-        env = os.environ.copy()
-        # Clean env to avoid conflicts
-        for k in ["PYTHONHOME", "PYTHONPATH", "LD_LIBRARY_PATH", "LIBPATH", "LD_PRELOAD"]:
-            if k in env: del env[k]
-        
-        env["OMP_NUM_THREADS"] = "1"
-        local_bin = os.path.join(self.os_doc.home_dir, ".local", "bin")
-        env["PATH"] = f"{local_bin}{os.pathsep}{env.get('PATH', '')}"
-
-        # NOTE: LD_LIBRARY_PATH injection removed to prevent Segfaults on Linux AMD.
-        # We rely on system/pipx paths and HSA_OVERRIDE from wrapper.
+        env = self.get_whisper_env()
 
         def build_cmd(force_cpu=False):
             # CHANGED: Enable FP16 (True). 
@@ -262,26 +453,32 @@ class AudioEngine:
             
             return cmd
 
+        def run_proc(run_cmd):
+            # Transcript text on stdout is not needed (JSON goes to output_dir);
+            # only the tail of stderr is kept for the GPU check and error log.
+            proc = subprocess.Popen(run_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                    text=True, env=env, startupinfo=startup_info)
+            tail = deque(proc.stderr, maxlen=1024)
+            proc.stderr.close()
+            return proc.wait(), "".join(tail)
+
         cmd = build_cmd()
         log_info(f"Running Whisper: {' '.join(cmd)}")
         
         try:
             startup_info = self.os_doc.get_startup_info()
-            result = subprocess.run(cmd, capture_output=True, text=True, env=env, startupinfo=startup_info)
-            
-            err_msg = result.stderr.lower()
-            gpu_failure_keywords = ["cuda", "driver", "gpu", "kernel", "torch", "segmentation fault", "code -11"]
+            returncode, stderr = run_proc(cmd)
             
             # Check for GPU failure and fallback
-            if result.returncode != 0 and device_mode != "CPU":
+            if returncode != 0 and device_mode != "CPU":
                 # If specifically a Segfault (-11) or GPU keywords found
-                if result.returncode == -11 or any(k in err_msg for k in gpu_failure_keywords):
+                if returncode == -11 or _GPU_FAIL_RE.search(stderr):
                     log_error("Whisper GPU Error (Crash/Segfault). Switching to CPU...")
                     cmd_cpu = build_cmd(force_cpu=True)
-                    result = subprocess.run(cmd_cpu, capture_output=True, text=True, env=env, startupinfo=startup_info)
+                    returncode, stderr = run_proc(cmd_cpu)
 
-            if result.returncode != 0:
-                log_error(f"Whisper Error (Code {result.returncode}): {result.stderr}")
+            if returncode != 0:
+                log_error(f"Whisper Error (Code {returncode}): {stderr}")
                 return None
             
             json_file = os.path.join(output_dir, unique_name + ".json")
@@ -295,39 +492,53 @@ class AudioEngine:
     # 2. AUDIO PROCESSING (FFMPEG)
     # ==========================================
 
-    def normalize_audio(self, input_path):
-        norm_path = input_path.replace(".wav", "_norm.wav")
-        cmd = [self.ffmpeg_cmd, "-y", "-i", input_path, "-af", "loudnorm=I=-23:LRA=7:tp=-2.0", 
-               "-ar", "48000", "-ac", "1", norm_path]
-        try:
-            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, 
-                           check=True, startupinfo=self.os_doc.get_startup_info())
-            return norm_path
-        except:
-            return input_path
-
-    def detect_silence(self, audio_path, threshold_db, min_dur):
-        cmd = [self.ffmpeg_cmd, "-i", audio_path, "-af", 
-               f"silencedetect=noise={threshold_db}dB:d={min_dur}", "-f", "null", "-"]
+    def detect_silence(self, audio_path, threshold_db, min_dur, pre_filter=None):
+        """
+        Runs ffmpeg silencedetect over the file and returns a list of SilenceRange.
+        pre_filter (optional) is an audio filter chain applied before detection;
+        if ffmpeg rejects it, detection is retried on the plain audio.
+        """
+        audio_filter = f"silencedetect=noise={threshold_db}dB:d={min_dur}"
+        if pre_filter:
+            audio_filter = f"{pre_filter},{audio_filter}"
+        cmd = [self.ffmpeg_cmd, "-i", audio_path, "-af", audio_filter, "-f", "null", "-"]
         try:
-            res = subprocess.run(cmd, stderr=subprocess.PIPE, text=True, 
-                                 startupinfo=self.os_doc.get_startup_info())
-            output = res.stderr
-            starts = [float(x) for x in re.findall(r'silence_start: (\d+\.?\d*)', output)]
-            ends = [float(x) for x in re.findall(r'silence_end: (\d+\.?\d*)', output)]
+            # stderr is consumed line by line as ffmpeg writes it, so the log of a
+            # long file is never held in memory as a whole
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, 
+                                    text=True, bufsize=1, startupinfo=self.os_doc.get_startup_info())
             
+            # Pair each start with the end that follows it
             ranges = []
-            count = min(len(starts), len(ends))
-            for i in range(count): 
-                ranges.append({'s': starts[i], 'e': ends[i]})
-            if len(starts) > len(ends): 
-                ranges.append({'s': starts[-1], 'e': 999999.0})
+            cur = None
+            with proc.stderr:
+                for line in proc.stderr:
+                    m = _SIL_RE.search(line)
+                    if not m: continue
+                    if m.group(1) == 'start':
+                        cur = float(m.group(2))
+                    elif cur is not None:
+                        ranges.append(SilenceRange(cur, float(m.group(2))))
+                        cur = None
+            if proc.wait() != 0 and pre_filter:
+                log_error(f"Silence pre-filter failed (Code {proc.returncode}), detecting on raw audio.")
+                return self.detect_silence(audio_path, threshold_db, min_dur)
+            if cur is not None: 
+                ranges.append(SilenceRange(cur, 999999.0)) # silence runs to the end of the file
                 
             return ranges
         except Exception as e:
             log_error(f"Silence Detection Error: {e}")
             return []
 
+    def detect_silence_normalized(self, wav_path, threshold_db=-45, min_dur=0.3):
+        """
+        Detects silence on loudness-normalized audio in a single ffmpeg pass.
+        Normalization happens inside the filter graph, so no normalized copy
+        of the wav is written to (and read back from) disk.
+        """
+        return self.detect_silence(wav_path, threshold_db, min_dur, pre_filter=_NORM_FILTER)
+
     # ==========================================
     # 3. MAIN ANALYSIS PIPELINE
     # ==========================================
@@ -339,8 +550,6 @@ class AudioEngine:
             if callback_progress: callback_progress(val)
 
         trans_status = settings.get("trans_status", {})
-        def get_status_msg(key, fallback="..."):
-            return trans_status.get(key, fallback)
 
         try:
             lang = settings.get('lang')
@@ -351,10 +560,18 @@ class AudioEngine:
             fps = self.resolve_handler.fps
             txt_inaudible = trans_status.get("txt_inaudible", "inaudible")
             
+            # Status texts, resolved once from the GUI translations
+            msg_render = trans_status.get("render", "Rendering...")
+            msg_check_model = trans_status.get("check_model", f"Checking {model}...")
+            msg_whisper = trans_status.get("whisper_run", f"Whisper {model}...")
+            msg_silence = trans_status.get("silence", "Silence detection...")
+            msg_processing = trans_status.get("processing", "Processing...")
+            msg_analysis = trans_status.get("init_analysis", "Analyzing...")
+            
             unique_id = f"BW_{int(time.time())}"
             update_progress(5)
 
-            update_status(get_status_msg("render", "Rendering..."))
+            update_status(msg_render)
             temp_dir = self.os_doc.get_temp_folder()
             
             # Ensure temp dir exists before rendering
@@ -367,30 +584,31 @@ class AudioEngine:
             
             update_progress(30)
 
-            update_status(get_status_msg("check_model", f"Checking {model}..."))
-            def dl_progress_cb(val): pass
-            self.download_whisper_model_interactive(model, dl_progress_cb)
-            
-            update_status(get_status_msg("whisper_run", f"Whisper {model}..."))
-            json_path = self.run_whisper(wav_path, model, lang, True, device_mode, filler_words)
-            if not json_path:
-                log_error("Whisper failed.")
-                return None, None
-            
-            update_progress(60)
+            # Silence detection only needs the rendered wav: ffmpeg runs on a worker
+            # thread while the model check and Whisper run here
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                silence_job = pool.submit(self.detect_silence_normalized, wav_path)
+                
+                update_status(msg_check_model)
+                def dl_progress_cb(val): pass
+                self.download_whisper_model_interactive(model, dl_progress_cb)
+                
+                update_status(msg_whisper)
+                json_path = self.run_whisper(wav_path, model, lang, True, device_mode, filler_words)
+                if not json_path:
+                    log_error("Whisper failed.")
+                    return None, None
+                
+                update_progress(60)
 
-            update_status(get_status_msg("silence", "Silence detection..."))
-            norm_wav = self.normalize_audio(wav_path)
-            silence_ranges = self.detect_silence(norm_wav, -45, 0.3)
-            if norm_wav != wav_path:
-                try: os.remove(norm_wav)
-                except: pass
+                update_status(msg_silence)
+                silence_ranges = silence_job.result()
             
             update_progress(80)
 
-            update_status(get_status_msg("processing", "Processing..."))
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            update_status(msg_processing)
+            with open(json_path, 'rb') as f:
+                data = _json_loads(f.read())
 
             words_data, segments_data = self._build_data_structure(data, silence_ranges, filler_words, fps, txt_inaudible)
 
@@ -400,7 +618,7 @@ class AudioEngine:
             update_progress(95)
             
             if words_data:
-                update_status(get_status_msg("init_analysis", "Analyzing..."))
+                update_status(msg_analysis)
                 words_data, _ = algorythms.analyze_repeats(words_data)
                 words_data = algorythms.absorb_inaudible_into_repeats(words_data)
 
@@ -413,7 +631,8 @@ class AudioEngine:
 
     def _build_data_structure(self, json_data, silence_ranges, filler_words, fps, txt_inaudible="inaudible"):
         temp_words = []
-        dynamic_bad = [w.lower().strip() for w in filler_words]
+        inaud_tmpl = dict(_INAUD_TMPL, text=txt_inaudible)
+        dynamic_bad = frozenset(w.lower().strip() for w in filler_words)
         
         for seg in json_data.get('segments', []):
             seg_start = seg.get('start', 0)
@@ -421,7 +640,7 @@ class AudioEngine:
             is_first = True
             
             for w in seg.get('words', []):
-                clean = re.sub(r'[^\w\s\'-]', '', w['word'].strip())
+                clean = _CLEAN_RE.sub('', w['word'].strip())
                 if clean:
                     is_bad = clean.lower() in dynamic_bad
                     w_obj = {
@@ -439,16 +658,17 @@ class AudioEngine:
 
         final_words = []
         
-        if silence_ranges and temp_words and silence_ranges[0]['e'] < temp_words[0]['start']:
-             s_start = silence_ranges[0]['s']
-             s_end = silence_ranges[0]['e']
+        # silencedetect ranges are disjoint, so sorted by start they are sorted by
+        # end as well: the ranges touching a gap form one run, found by bisection
+        silence_ranges.sort(key=attrgetter('s'))
+        sil_ends = [s.e for s in silence_ranges]
+        sil_count = len(silence_ranges)
+        
+        if silence_ranges and temp_words and silence_ranges[0].e < temp_words[0]['start']:
+             s_start, s_end = silence_ranges[0]
              # Only add initial silence if significant
              if s_end - s_start > 0.1:
-                 final_words.append({
-                     "start": s_start, "end": s_end, "text": "[SILENCE]",
-                     "type": "silence", "status": "silence", "selected": False,
-                     "seg_start": 0, "seg_end": 0, "is_segment_start": False
-                 })
+                 final_words.append(dict(_SIL_TMPL, start=s_start, end=s_end))
 
         if temp_words:
             final_words.append(temp_words[0])
@@ -462,50 +682,37 @@ class AudioEngine:
                 gap_end = curr_w['start']
                 current_pos = gap_start
                 
-                # Check for silence in gap
-                relevant = [s for s in silence_ranges if s['e'] > gap_start and s['s'] < gap_end]
-                relevant.sort(key=lambda x: x['s'])
+                # Check for silence in gap (e > gap_start and s < gap_end)
+                relevant = []
+                k = bisect_right(sil_ends, gap_start)
+                while k < sil_count and silence_ranges[k].s < gap_end:
+                    relevant.append(silence_ranges[k])
+                    k += 1
 
                 if not relevant:
                     if (gap_end - gap_start) >= 0.5:
-                        final_words.append({
-                            "start": gap_start, "end": gap_end,
-                            "text": txt_inaudible,
-                            "type": "inaudible", "status": "inaudible", "selected": True, "is_inaudible": True,
-                            "seg_start": curr_w['seg_start'], "seg_end": curr_w['seg_end'], "is_segment_start": False
-                        })
+                        final_words.append(dict(inaud_tmpl, start=gap_start, end=gap_end,
+                                                seg_start=curr_w['seg_start'], seg_end=curr_w['seg_end']))
                 else:
                     for s in relevant:
                         # Only insert silence if it's substantial
-                        valid_start = max(current_pos, s['s'])
-                        valid_end = min(s['e'], gap_end)
+                        valid_start = max(current_pos, s.s)
+                        valid_end = min(s.e, gap_end)
                         
                         # Gap before silence? -> Inaudible
                         if valid_start - current_pos > 0.3:
-                             final_words.append({
-                                "start": current_pos, "end": valid_start,
-                                "text": txt_inaudible,
-                                "type": "inaudible", "status": "inaudible", "selected": True, "is_inaudible": True,
-                                "seg_start": curr_w['seg_start'], "seg_end": curr_w['seg_end'], "is_segment_start": False
-                            })
+                             final_words.append(dict(inaud_tmpl, start=current_pos, end=valid_start,
+                                                     seg_start=curr_w['seg_start'], seg_end=curr_w['seg_end']))
                              current_pos = valid_start
 
                         if valid_end - valid_start > 0.1:
-                            final_words.append({
-                                "start": valid_start, "end": valid_end,
-                                "text": "[SILENCE]",
-                                "type": "silence", "status": "silence", "selected": False,
-                                "seg_start": curr_w['seg_start'], "seg_end": curr_w['seg_end'], "is_segment_start": False
-                            })
+                            final_words.append(dict(_SIL_TMPL, start=valid_start, end=valid_end,
+                                                    seg_start=curr_w['seg_start'], seg_end=curr_w['seg_end']))
                             current_pos = valid_end
                     
                     if gap_end - current_pos > 0.3:
-                        final_words.append({
-                            "start": current_pos, "end": gap_end,
-                            "text": txt_inaudible,
-                            "type": "inaudible", "status": "inaudible", "selected": True, "is_inaudible": True,
-                            "seg_start": curr_w['seg_start'], "seg_end": curr_w['seg_end'], "is_segment_start": False
-                        })
+                        final_words.append(dict(inaud_tmpl, start=current_pos, end=gap_end,
+                                                seg_start=curr_w['seg_start'], seg_end=curr_w['seg_end']))
 
                 final_words.append(curr_w)
 
@@ -545,22 +752,30 @@ class AudioEngine:
         do_show_inaudible = settings.get('show_inaudible', True)
         do_auto_del = settings.get('auto_del', False)
 
-        def t2f(t): return int(round(t * fps))
-        
+        # Seconds -> frames is int(round(t * fps)), written inline where it's used
         offset_f = int(round(offset_s * fps))
         pad_f = int(round(pad_s * fps))
+        cut_shift_f = offset_f - pad_f
         snap_f = int(round(snap_max_s * fps))
 
-        # Separate Silence for Overlay
-        silence_blocks = [w for w in words_data if w.get('type') == 'silence']
-        
         # --- PHASE 1: CHUNKING (Group words into continuous blocks) ---
-        chunks = []
-        current_chunk = None
+        # A single pass over words_data separates silence (for snapping and the
+        # overlay), drops hidden inaudible entries and groups the rest into chunks.
+        # Silence blips under 0.2s are dropped here: they are never punched out,
+        # and cuts shouldn't snap to them either.
+        silence_blocks = []
+        
+        # Chunks are kept as parallel lists (status, first word start, last word end);
+        # the boundary logic below never needs the words in between.
+        chunk_status = []
+        chunk_start = []
+        chunk_end = []
         
-        processed_words = []
         for w in words_data:
-            if w.get('type') == 'silence': continue
+            if w.get('type') == 'silence':
+                if (w['end'] - w['start']) >= 0.2:
+                    silence_blocks.append(w)
+                continue
             
             # --- INAUDIBLE HANDLING START ---
             # If word is inaudible, check its status.
@@ -578,11 +793,6 @@ class AudioEngine:
                     continue
             # --- INAUDIBLE HANDLING END ---
             
-            processed_words.append(w)
-
-        if not processed_words: return []
-
-        for w in processed_words:
             # Determine status for Chunking
             status = w.get('status', 'normal')
             if status is None: status = 'normal'
@@ -591,140 +801,99 @@ class AudioEngine:
             # If user changed it to 'bad', status is 'bad' -> Red
             
             # Start new chunk if status changes or no chunk exists
-            if current_chunk is None:
-                current_chunk = {'status': status, 'words': [w]}
+            if chunk_status and chunk_status[-1] == status:
+                chunk_end[-1] = w['end']
             else:
-                if current_chunk['status'] == status:
-                    current_chunk['words'].append(w)
-                else:
-                    chunks.append(current_chunk)
-                    current_chunk = {'status': status, 'words': [w]}
+                chunk_status.append(status)
+                chunk_start.append(w['start'])
+                chunk_end.append(w['end'])
         
-        if current_chunk: chunks.append(current_chunk)
+        if not chunk_status: return []
+        chunk_count = len(chunk_status)
+        
+        # Frame positions of every silence in time order, converted once and
+        # shared by the snap logic and the overlay.
+        # Silences are disjoint, so in time order their ends are sorted too: the
+        # only one that can be within snap range of a cut is the first silence
+        # ending no earlier than cut - snap (any later one starts after it ends)
+        sil_frames = sorted((int(round(s['start'] * fps)), int(round(s['end'] * fps))) for s in silence_blocks)
+        sil_ends = [e for _, e in sil_frames]
+        sil_count = len(sil_frames)
 
         # --- PHASE 2: CALCULATE BOUNDARIES (The MPF Logic) ---
-        # Instead of cutting every word, we cut only between chunks
+        # Instead of cutting every word, we cut only between chunks.
+        # Each block starts where the previous one ends, so the blocks are stored
+        # as one list of frame boundaries next to chunk_status: block i spans
+        # bounds[i]..bounds[i+1]. Ops are (start_f, end_f, type) tuples in time
+        # order; every later phase keeps that order, so nothing needs re-sorting.
         
-        ops_raw = []
-        current_time_f = 0
+        bounds = [0]
         
-        for i, chunk in enumerate(chunks):
-            chunk_end_w = chunk['words'][-1]['end']
-            block_start_f = current_time_f
+        for i in range(chunk_count):
+            chunk_end_w = chunk_end[i]
+            block_start_f = bounds[i]
             
-            if i < len(chunks) - 1:
-                next_chunk_start = chunks[i+1]['words'][0]['start']
+            if i < chunk_count - 1:
+                next_chunk_start = chunk_start[i+1]
                 raw_cut = next_chunk_start
-                cut_f = t2f(raw_cut) + offset_f - pad_f
+                cut_f = int(round(raw_cut * fps)) + cut_shift_f
                 
                 # Snap to Silence Logic
-                for s in silence_blocks:
-                    s_start_f = t2f(s['start'])
-                    s_end_f = t2f(s['end'])
-                    
+                k = bisect_left(sil_ends, cut_f - snap_f)
+                if k < sil_count:
+                    s_start_f, s_end_f = sil_frames[k]
                     if abs(cut_f - s_start_f) <= snap_f:
                         cut_f = s_start_f
-                        break
-                    if abs(cut_f - s_end_f) <= snap_f:
+                    elif abs(cut_f - s_end_f) <= snap_f:
                         cut_f = s_end_f
-                        break
                 
                 if cut_f < block_start_f: cut_f = block_start_f + 1
                 block_end_f = cut_f
             else:
-                block_end_f = t2f(chunk_end_w) + offset_f + pad_f + 100 
+                block_end_f = int(round(chunk_end_w * fps)) + offset_f + pad_f + 100 
             
-            ops_raw.append({
-                's': block_start_f,
-                'e': block_end_f,
-                'type': chunk['status']
-            })
-            
-            current_time_f = block_end_f
+            bounds.append(block_end_f)
+        
+        ops_raw = zip(bounds, bounds[1:], chunk_status)
 
         # --- PHASE 3: OVERLAY SILENCE (The Punch) ---
-        if do_silence_cut or do_silence_mark:
-            final_ops = []
-            
-            s_ranges = []
-            for s in silence_blocks:
-                if (s['end'] - s['start']) < 0.2: continue 
-                s_ranges.append((t2f(s['start']), t2f(s['end'])))
-            
-            ops_raw.sort(key=lambda x: x['s'])
-            
-            for op in ops_raw:
-                # SPECIAL MERGE LOGIC (Updated):
-                # If op is BAD (Red) and we are only MARKING silence, skip this op (don't punch holes)
-                # This keeps the BAD clip continuous, covering the silence.
-                # Also applies if op is INAUDIBLE (Chocolate) and we mark silence.
-                if (op['type'] == 'bad' or op['type'] == 'inaudible') and do_silence_mark and not do_silence_cut:
-                    final_ops.append(op)
-                    continue
-
-                sub_segments = [op]
-                
-                for s_s, s_e in s_ranges:
-                    new_sub = []
-                    for sub in sub_segments:
-                        # Case 1: Silence is outside
-                        if s_e <= sub['s'] or s_s >= sub['e']:
-                            new_sub.append(sub)
-                        # Case 2: Silence covers completely
-                        elif s_s <= sub['s'] and s_e >= sub['e']:
-                            if do_silence_mark:
-                                new_sub.append({'s': sub['s'], 'e': sub['e'], 'type': 'silence_mark'})
-                        # Case 3: Overlap
-                        else:
-                            # Part before silence
-                            if s_s > sub['s']:
-                                new_sub.append({'s': sub['s'], 'e': s_s, 'type': sub['type']})
-                            
-                            # The silence part
-                            if do_silence_mark:
-                                overlap_s = max(sub['s'], s_s)
-                                overlap_e = min(sub['e'], s_e)
-                                new_sub.append({'s': overlap_s, 'e': overlap_e, 'type': 'silence_mark'})
-                            
-                            # Part after silence
-                            if s_e < sub['e']:
-                                new_sub.append({'s': s_e, 'e': sub['e'], 'type': sub['type']})
-                                
-                    sub_segments = new_sub
-                
-                final_ops.extend(sub_segments)
-            
-            ops_raw = final_ops
+        # Each enabled mode combination has its own splitter (see _SILENCE_OVERLAY)
+        overlay = _SILENCE_OVERLAY.get((bool(do_silence_mark), bool(do_silence_cut)))
+        if overlay:
+            ops_raw = overlay(ops_raw, sil_frames)
 
         # --- PHASE 4: FILTERING & CLEANUP ---
-        # Sort and merge same adjacent types (to fix fragmentation from silence processing)
-        ops_raw.sort(key=lambda x: x['s'])
-        
-        merged_ops = []
-        if ops_raw:
-            curr = ops_raw[0]
-            for next_op in ops_raw[1:]:
+        # Merge same adjacent types (to fix fragmentation from silence processing).
+        # Without the overlay the ops are the Phase 2 blocks, and neighbouring
+        # blocks never share a status (chunks split on every status change).
+        if not (do_silence_cut or do_silence_mark):
+            merged_ops = ops_raw
+        elif ops_raw:
+            merged_ops = []
+            ops_iter = iter(ops_raw)  # no ops_raw[1:] copy
+            curr_s, curr_e, curr_type = next(ops_iter)
+            for next_s, next_e, next_type in ops_iter:
                 # Merge if same type and touching/overlapping
-                if next_op['type'] == curr['type'] and next_op['s'] <= curr['e'] + 1:
-                    curr['e'] = max(curr['e'], next_op['e'])
+                if next_type == curr_type and next_s <= curr_e + 1:
+                    curr_e = max(curr_e, next_e)
                 else:
-                    merged_ops.append(curr)
-                    curr = next_op
-            merged_ops.append(curr)
-            
-        final_result = []
-        for op in merged_ops:
-            # Auto-Delete Logic
-            # Delete BAD clips?
-            if do_auto_del and op['type'] == 'bad': continue
-            # Delete Inaudible clips? Usually user wants to see them if they enabled 'Show Inaudible'
-            # But if they manually marked it 'bad', it's handled above.
-            # If it's still 'inaudible' type, we keep it (chocolate).
-            
-            if op['e'] - op['s'] < 2: continue 
-            final_result.append(op)
+                    merged_ops.append((curr_s, curr_e, curr_type))
+                    curr_s, curr_e, curr_type = next_s, next_e, next_type
+            merged_ops.append((curr_s, curr_e, curr_type))
+        else:
+            merged_ops = []
             
-        return final_result
+        # Auto-Delete Logic
+        # Delete BAD clips? (op types are never None, so None drops nothing)
+        # Delete Inaudible clips? Usually user wants to see them if they enabled 'Show Inaudible'
+        # But if they manually marked it 'bad', it's handled above.
+        # If it's still 'inaudible' type, we keep it (chocolate).
+        drop_type = 'bad' if do_auto_del else None
+        
+        # One pass: auto-delete and the 2-frame minimum, straight into result dicts
+        return [{'s': op_s, 'e': op_e, 'type': op_type}
+                for op_s, op_e, op_type in merged_ops
+                if op_type != drop_type and op_e - op_s >= 2]
 
     # ==========================================
     # 5. PROJECT & DATA MANAGEMENT (Data Controller)
@@ -770,8 +939,8 @@ class AudioEngine:
         GUI is responsible for parsing settings back to vars.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                project_state = json.load(f)
+            with open(file_path, 'rb') as f:
+                project_state = _json_loads(f.read())
             
             words = project_state.get("words_data", [])
             segments = self._reconstruct_segments(words)
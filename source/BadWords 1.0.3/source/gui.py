@@ -24,9 +24,12 @@ import platform
 import subprocess
 import os
 import time
+from functools import lru_cache
+from operator import itemgetter
 
 import config
 import algorythms
+from osdoc import log_info, log_error
 
 # ==========================================
 # WINDOW POSITIONING & STYLE HELPERS
@@ -113,6 +116,47 @@ def apply_title_bar_style(window):
         except Exception:
             pass
 
+@lru_cache(maxsize=16)
+def _font_for(font_key):
+    """
+    One Font object per Tk font description, reused across renders.
+    Keyed on the font string, so a font change simply gets a new object.
+    """
+    return font.Font(font=font_key)
+
+@lru_cache(maxsize=4096)
+def _measure(font_key, text):
+    """Pixel width of text in the given Tk font description."""
+    return _font_for(font_key).measure(text)
+
+@lru_cache(maxsize=64)
+def _linespace(font_key):
+    """Line height in pixels for the given Tk font description."""
+    return max(1, _font_for(font_key).metrics("linespace"))
+
+_TCL_SPECIAL = re.compile(r'[\\\[\]{}$";\s]')
+_TCL_ESCAPES = {"\n": "\\n", "\t": "\\t", "\r": "\\r"}
+
+@lru_cache(maxsize=16384)
+def _tcl_arg(value):
+    """
+    One word of a Tcl script that evaluates to value without substitution:
+    strings are backslash-escaped, tag tuples become a braced list.
+    """
+    if isinstance(value, tuple):
+        return "{" + " ".join(value) + "}"
+    if not value:
+        return "{}"
+    return _TCL_SPECIAL.sub(lambda m: _TCL_ESCAPES.get(m.group(), "\\" + m.group()), value)
+
+@lru_cache(maxsize=8192)
+def _fmt_seconds(total_seconds):
+    """HH:MM:SS for a whole number of seconds (timestamps repeat across renders)."""
+    h = total_seconds // 3600
+    m = (total_seconds % 3600) // 60
+    s = total_seconds % 60
+    return f"{h:02d}:{m:02d}:{s:02d}"
+
 # ==========================================
 # CUSTOM WIDGETS
 # ==========================================
@@ -501,6 +545,29 @@ class CustomConfirm(tk.Toplevel):
 # ==========================================
 
 class BadWordsGUI:
+    # Words rendered per idle tick, for both the front page and the back buffer
+    RENDER_CHUNK_WORDS = 500
+    
+    # Segment header as laid out before its separator (timestamp, then two spaces)
+    HEADER_FMT = "[{0}] - [{1}]  "
+
+    # Status tags a freshly rendered word carries, by its state tag
+    RENDERED_STATUS_TAGS = {
+        "normal": ("normal",),
+        "bad": ("normal", "bad"),
+        "repeat": ("normal", "repeat"),
+        "typo": ("normal", "typo"),
+        "inaudible": ("normal", "inaudible"),
+    }
+    
+    # Reviewer marking tools: (translation key, tool value, label color)
+    MARK_TOOLS = (
+        ("rb_mark_red", "bad", config.WORD_BAD_BG),
+        ("rb_mark_blue", "repeat", config.WORD_REPEAT_BG),
+        ("rb_mark_green", "typo", config.WORD_TYPO_BG),
+        ("rb_mark_white", "eraser", "#cccccc"),
+    )
+
     def __init__(self, root, engine, resolve_handler):
         self.root = root
         self.root.withdraw()
@@ -538,6 +605,14 @@ class BadWordsGUI:
         self.segments_data = []
         self.filler_words = list(config.DEFAULT_BAD_WORDS)
         self.separator_frames = []
+        self._prerender_job = None
+        self._prerender_plan = None
+        self._plan_cache = {}
+        self._stale_plans = set()
+        self._render_ctx = None  # front page still being filled in (see _render_chunk)
+        self._render_job = None
+        self._last_sep_width = None
+        self._text_w = 1  # transcript width, kept current by on_text_resize
         
         self.page_size = 25  
         self.current_page = 0
@@ -551,6 +626,8 @@ class BadWordsGUI:
         
         self.is_dragging = False
         self.last_dragged_id = -1
+        self._drag_pending = {}  # word ids swept since the last flush (ordered)
+        self._drag_timer = None
         
         self.model_map = {}
 
@@ -640,7 +717,17 @@ class BadWordsGUI:
                   background=[('active', config.SIDEBAR_BG), ('!disabled', config.SIDEBAR_BG)],
                   foreground=[('active', config.FG_COLOR), ('!disabled', config.FG_COLOR)])
 
+        # Reviewer sidebar radio style (process-wide, configured once)
+        style.configure("TRadiobutton", background=config.SIDEBAR_BG, foreground="white", font=self.font_norm)
+
     def clear_window(self):
+        self._cancel_prerender()
+        self._cancel_render_chunks()
+        # A pending drag flush would retag the text area destroyed below
+        if self._drag_timer is not None:
+            self.root.after_cancel(self._drag_timer)
+            self._drag_timer = None
+        self._drag_pending.clear()
         if self.current_frame: self.current_frame.destroy()
         for widget in self.root.winfo_children(): 
             if isinstance(widget, tk.Toplevel): continue 
@@ -830,7 +917,7 @@ class BadWordsGUI:
                 name = data.get("name", code.upper())
                 options.append((name, code))
             
-            options.sort(key=lambda x: x[0])
+            options.sort(key=itemgetter(0))
 
             self.menu_window = ScrollableMenu(self.root, options, self.set_language, x, y, width=menu_w)
             return "break"
@@ -1380,22 +1467,22 @@ class BadWordsGUI:
                                        font=self.font_small, cursor="hand2")
         self.btn_next_page.pack(side="left")
         
-        text_scroll = ModernScrollbar(frame_trans, width=14, active_color="#303031")
-        text_scroll.pack(side="right", fill="y", padx=(0, 0)) 
-        
-        self.text_area = tk.Text(frame_trans, bg=config.INPUT_BG, fg=config.WORD_NORMAL_FG, insertbackground="white",
-                                 relief="flat", bd=0, highlightthickness=0, font=(config.UI_FONT_NAME, 12), wrap="word", 
-                                 padx=15, pady=15, cursor="arrow", yscrollcommand=text_scroll.set,
-                                 selectbackground=config.INPUT_BG, selectforeground=config.WORD_NORMAL_FG, inactiveselectbackground=config.INPUT_BG)
-        self.text_area.pack(fill="both", expand=True)
+        self.text_scroll = ModernScrollbar(frame_trans, width=14, active_color="#303031")
+        self.text_scroll.pack(side="right", fill="y", padx=(0, 0)) 
         
-        text_scroll.command = self.text_area.yview
+        # Double buffer: only the front widget is packed, the back one pre-renders the next page
+        self.text_area = self._create_text_area(frame_trans)
+        self._text_area_back = self._create_text_area(frame_trans)
+        self.separator_frames = []
+        self._back_separator_frames = []
+        self._back_page = None
+        self._seg_starts = {}
+        self._sep_pools = {}
+        self._word_tags = {}
         
-        self._configure_text_tags()
-        self.text_area.configure(state="disabled")
-
-        self.text_area.update_idletasks()
-        self.text_area.bind("<Configure>", self.on_text_resize)
+        self.text_area.configure(yscrollcommand=self.text_scroll.set)
+        self.text_area.pack(fill="both", expand=True)
+        self.text_scroll.command = self.text_area.yview
 
         sb_header = tk.Frame(frame_sidebar, bg=config.SIDEBAR_BG)
         sb_header.pack(fill="x", padx=15, pady=15)
@@ -1404,19 +1491,14 @@ class BadWordsGUI:
 
         tk.Label(frame_sidebar, text=self.txt("lbl_mark_color"), bg=config.SIDEBAR_BG, fg=config.NOTE_COL, font=(config.UI_FONT_NAME, 9)).pack(anchor="w", padx=15, pady=(5,5))
         
-        style = ttk.Style()
-        style.configure("TRadiobutton", background=config.SIDEBAR_BG, foreground="white", font=self.font_norm)
-        
         def add_tool_rb(text_key, val, color, white_mode=False):
              tk.Radiobutton(frame_sidebar, text=self.txt(text_key), variable=self.var_mark_tool, value=val,
                        bg=config.SIDEBAR_BG, fg=color, selectcolor="black" if not white_mode else "gray", 
                        activebackground=config.SIDEBAR_BG, activeforeground=color,
                        font=self.font_bold, indicatoron=1, cursor="hand2", bd=0, highlightthickness=0).pack(anchor="w", padx=10, pady=2)
 
-        add_tool_rb("rb_mark_red", "bad", config.WORD_BAD_BG)
-        add_tool_rb("rb_mark_blue", "repeat", config.WORD_REPEAT_BG)
-        add_tool_rb("rb_mark_green", "typo", config.WORD_TYPO_BG)
-        add_tool_rb("rb_mark_white", "eraser", "#cccccc")
+        for text_key, val, color in self.MARK_TOOLS:
+            add_tool_rb(text_key, val, color)
 
         tk.Frame(frame_sidebar, height=1, bg=config.SEPARATOR_COL).pack(fill="x", padx=10, pady=15)
 
@@ -1557,9 +1639,10 @@ class BadWordsGUI:
     def start_standalone_thread(self):
         self.set_status(self.txt("status_standalone"))
         self.set_progress(10)
-        threading.Thread(target=self.run_standalone_logic, daemon=True).start()
+        before = self._status_snapshot()
+        threading.Thread(target=self.run_standalone_logic, args=(before,), daemon=True).start()
 
-    def run_standalone_logic(self):
+    def run_standalone_logic(self, before):
         # Auto-cleaning removed per user request
         
         self.set_progress(40)
@@ -1567,7 +1650,7 @@ class BadWordsGUI:
         self.words_data, count = self.engine.run_standalone_analysis(self.words_data, show_inaudible=self.var_show_inaudible.get())
         
         self.set_progress(100)
-        self.root.after(0, lambda: self.populate_text_area())
+        self.root.after(0, lambda: self._apply_status_diff(before))
         self.set_status(self.txt("status_done"))
         self.root.after(2000, lambda: self.set_progress(0))
 
@@ -1583,13 +1666,14 @@ class BadWordsGUI:
         self.set_progress(10)
         
         if script_text:
-            threading.Thread(target=self.run_comparison_logic, args=(script_text,), daemon=True).start()
+            before = self._status_snapshot()
+            threading.Thread(target=self.run_comparison_logic, args=(script_text, before), daemon=True).start()
         else:
             self.set_progress(0)
             self.set_status(self.txt("status_ready"))
             CustomMessage(self.root, self.txt("title_confirm"), self.txt("err_noscript"))
 
-    def run_comparison_logic(self, script_text):
+    def run_comparison_logic(self, script_text, before):
         self.set_status(self.txt("status_comparing"))
         self.set_progress(20)
         
@@ -1600,7 +1684,7 @@ class BadWordsGUI:
              self.root.after(0, lambda: self.highlight_script_missing(script_text, result.missing_indices))
 
         self.set_progress(100)
-        self.root.after(0, lambda: self.populate_text_area())
+        self.root.after(0, lambda: self._apply_status_diff(before))
         self.set_status(self.txt("status_compared", diffs="Done"))
         self.root.after(2000, lambda: self.set_progress(0))
         
@@ -1693,17 +1777,32 @@ class BadWordsGUI:
 
     def toggle_auto_fillers(self):
         enabled = self.var_auto_filler.get()
+        before = self._status_snapshot()
         self.words_data = algorythms.apply_auto_filler_logic(self.words_data, self.filler_words, enabled)
-        self.populate_text_area()
-
-    def _configure_text_tags(self):
-        self.text_area.tag_configure("normal", foreground=config.WORD_NORMAL_FG, background=config.INPUT_BG)
-        self.text_area.tag_configure("bad", background=config.WORD_BAD_BG, foreground=config.WORD_BAD_FG)
-        self.text_area.tag_configure("repeat", background=config.WORD_REPEAT_BG, foreground=config.WORD_REPEAT_FG)
-        self.text_area.tag_configure("typo", background=config.WORD_TYPO_BG, foreground=config.WORD_TYPO_FG)
-        self.text_area.tag_configure("inaudible", background=config.WORD_INAUDIBLE_BG, foreground=config.WORD_INAUDIBLE_FG)
-        self.text_area.tag_configure("hover", background=config.WORD_HOVER_BG) 
-        self.text_area.tag_configure("timestamp_style", foreground=config.NOTE_COL, font=(config.UI_FONT_NAME, 9, "bold"))
+        
+        # Status-only change: retag the affected words instead of rebuilding the page
+        self._apply_status_diff(before)
+
+    def _create_text_area(self, parent):
+        """Creates one (unpacked) transcript Text widget with tags and bindings."""
+        text_area = tk.Text(parent, bg=config.INPUT_BG, fg=config.WORD_NORMAL_FG, insertbackground="white",
+                            relief="flat", bd=0, highlightthickness=0, font=(config.UI_FONT_NAME, 12), wrap="word", 
+                            padx=15, pady=15, cursor="arrow",
+                            selectbackground=config.INPUT_BG, selectforeground=config.WORD_NORMAL_FG, inactiveselectbackground=config.INPUT_BG)
+        self._configure_text_tags(text_area)
+        text_area.configure(state="disabled")
+        text_area.bind("<Configure>", self.on_text_resize)
+        self.setup_bindings(text_area)
+        return text_area
+
+    def _configure_text_tags(self, text_area):
+        text_area.tag_configure("normal", foreground=config.WORD_NORMAL_FG, background=config.INPUT_BG)
+        text_area.tag_configure("bad", background=config.WORD_BAD_BG, foreground=config.WORD_BAD_FG)
+        text_area.tag_configure("repeat", background=config.WORD_REPEAT_BG, foreground=config.WORD_REPEAT_FG)
+        text_area.tag_configure("typo", background=config.WORD_TYPO_BG, foreground=config.WORD_TYPO_FG)
+        text_area.tag_configure("inaudible", background=config.WORD_INAUDIBLE_BG, foreground=config.WORD_INAUDIBLE_FG)
+        text_area.tag_configure("hover", background=config.WORD_HOVER_BG) 
+        text_area.tag_configure("timestamp_style", foreground=config.NOTE_COL, font=(config.UI_FONT_NAME, 9, "bold"))
 
     def update_pagination_ui(self):
         if self.lbl_page_info:
@@ -1718,20 +1817,47 @@ class BadWordsGUI:
     def prev_page(self):
         if self.current_page > 0:
             self.current_page -= 1
-            self.populate_text_area()
+            self.populate_text_area(use_prerender=True)
 
     def next_page(self):
         if self.current_page < self.total_pages - 1:
             self.current_page += 1
-            self.populate_text_area()
+            self.populate_text_area(use_prerender=True)
 
     def format_seconds(self, seconds):
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        s = int(seconds % 60)
-        return f"{h:02d}:{m:02d}:{s:02d}"
-
-    def populate_text_area(self):
+        # Only whole seconds are displayed, so the truncated value is the cache key
+        return _fmt_seconds(int(seconds))
+
+    def _get_page_plan(self, page):
+        """
+        Render plan of a page, cached across page flips. Status changes only mark
+        cached plans stale (their states are refreshed on the next use); anything
+        else that calls populate_text_area() drops the cache.
+        """
+        key = (page, self.page_size, self.var_show_inaudible.get())
+        plan = self._plan_cache.get(key)
+        if plan is not None:
+            if key in self._stale_plans:
+                algorythms.refresh_render_states(plan)
+                self._stale_plans.discard(key)
+            return plan
+        
+        start_seg_idx = page * self.page_size
+        end_seg_idx = start_seg_idx + self.page_size
+        words = [w for seg in self.segments_data[start_seg_idx:end_seg_idx] for w in seg]
+        plan = algorythms.build_render_plan(words, key[2])
+        self._plan_cache[key] = plan
+        return plan
+
+    def populate_text_area(self, use_prerender=False):
+        """
+        Shows the current page. Page navigation swaps in the back buffer when it
+        already holds the requested page; any other call re-renders from words_data.
+        """
+        if not use_prerender:
+            self._plan_cache.clear()
+            self._stale_plans.clear()
+        
         total_segments = len(self.segments_data)
         if total_segments == 0:
             self.total_pages = 1
@@ -1745,164 +1871,304 @@ class BadWordsGUI:
         
         current_y_view = self.text_area.yview()
         
-        self.separator_frames = []
+        if use_prerender and self._prerender_job is None and self._back_page == self.current_page:
+            self._swap_text_buffers()
+        else:
+            self._build_full(current_y_view)
         
-        start_seg_idx = self.current_page * self.page_size
-        end_seg_idx = start_seg_idx + self.page_size
-        current_batch_segments = self.segments_data[start_seg_idx:end_seg_idx]
-        current_batch_words = [w for seg in current_batch_segments for w in seg]
+        # No update_idletasks() here: yview_moveto works on the pending layout, and
+        # separator widths come from self._text_w rather than a fresh winfo_width()
+        if current_y_view:
+            self.text_area.yview_moveto(current_y_view[0])
+            
+        self.on_text_resize(None)
+        self._schedule_prerender()
+
+    def _build_full(self, current_y_view):
+        """
+        Rebuilds the front widget from the current page plan. Only page/data changes
+        should get here; marking goes through _apply_status_updates. Logged so that
+        an accidental full rebuild shows up in the log.
+        """
+        self._cancel_prerender()
+        self._cancel_render_chunks()
+        self._back_page = None
+        plan = self._get_page_plan(self.current_page)
+        log_info(f"Transcript rebuild: page {self.current_page + 1}/{self.total_pages}, {len(plan)} words")
+        ctx = self._begin_render(self.text_area, self.separator_frames)
+        
+        # Only the segments that fit the viewport are built now; the rest of the
+        # page is appended in idle-time chunks (see _render_chunk).
+        # Restoring a scrolled position needs the whole page to be there.
+        if current_y_view and current_y_view[0] > 0:
+            stop = len(plan)
+        else:
+            stop = self._segment_stop(plan, 0, self._visible_segments(self.text_area, ctx))
+        self._render_words(self.text_area, plan, 0, stop, ctx)
+        self.text_area.configure(state="disabled")
+        if stop < len(plan):
+            ctx.update(widget=self.text_area, plan=plan, next=stop)
+            self._render_ctx = ctx
+            self._render_job = self.root.after_idle(self._render_chunk)
+
+    def _swap_text_buffers(self):
+        """Brings the pre-rendered back buffer to the front (pack swap, no redraw)."""
+        front, back = self.text_area, self._text_area_back
+        front.pack_forget()
+        front.configure(yscrollcommand="")
+        back.configure(yscrollcommand=self.text_scroll.set)
+        back.pack(fill="both", expand=True)
+        self.text_scroll.command = back.yview
+        
+        self.text_area, self._text_area_back = back, front
+        self.separator_frames, self._back_separator_frames = self._back_separator_frames, self.separator_frames
+        self._back_page = None
+        self._cancel_render_chunks()
+
+    def _visible_segments(self, widget, ctx):
+        """
+        How many segments to build up front: one per visible line is a safe upper
+        bound, since every segment takes at least a header line and a word line.
+        """
+        return max(1, widget.winfo_height() // _linespace(ctx["font_key"])) + 1
+
+    def _segment_stop(self, plan, i, segments):
+        """Plan index right after `segments` segments counted from index i."""
+        seen = 0
+        for j in range(i, len(plan)):
+            if plan[j].is_segment_start:
+                seen += 1
+                if seen > segments: return j
+        return len(plan)
+
+    def _render_chunk(self):
+        """
+        Appends the next RENDER_CHUNK_WORDS words of the front page, then yields to
+        the event loop (after_idle) until the page is complete, so a long page never
+        blocks input or repaint.
+        """
+        self._render_job = None
+        rc = self._render_ctx
+        if not rc: return
+        widget, plan = rc["widget"], rc["plan"]
+        if widget is not self.text_area:
+            self._render_ctx = None
+            return
         
-        self.text_area.configure(state="normal")
-        self.text_area.delete("1.0", tk.END)
+        i = rc["next"]
+        try:
+            widget.configure(state="normal")
+            rc["next"] = self._render_words(widget, plan, i, min(i + self.RENDER_CHUNK_WORDS, len(plan)), rc)
+            widget.configure(state="disabled")
+        except tk.TclError:
+            self._render_ctx = None
+            return
         
-        show_inaudible = self.var_show_inaudible.get()
+        if rc["next"] < len(plan):
+            self._render_job = self.root.after_idle(self._render_chunk)
+        else:
+            self._render_ctx = None
+            self.on_text_resize(None)
+
+    def _cancel_render_chunks(self):
+        if self._render_job:
+            try: self.root.after_cancel(self._render_job)
+            except: pass
+            self._render_job = None
+        self._render_ctx = None
+
+    def _schedule_prerender(self):
+        """Renders the next page into the hidden buffer, chunk by chunk, on idle."""
+        self._cancel_prerender()
+        page = self.current_page + 1
+        if page >= self.total_pages: return
         
-        batch_len = len(current_batch_words)
-        i = 0
+        widget = self._text_area_back
+        plan = self._get_page_plan(page)
+        ctx = self._begin_render(widget, self._back_separator_frames)
+        self._prerender_plan = plan
         
-        current_w = self.text_area.winfo_width()
-        font_obj = font.Font(font=self.text_area.cget("font"))
+        def step(i=0):
+            try:
+                # Status updates may have disabled the buffer since the last chunk
+                widget.configure(state="normal")
+                i = self._render_words(widget, plan, i, min(i + self.RENDER_CHUNK_WORDS, len(plan)), ctx)
+                widget.configure(state="disabled")
+            except tk.TclError:
+                self._prerender_job = None
+                return
+            if i < len(plan):
+                self._prerender_job = self.root.after_idle(lambda: step(i))
+            else:
+                self._prerender_job = None
+                self._back_page = page
         
-        while i < batch_len:
-            w_obj = current_batch_words[i]
-            
-            if w_obj.get('type') == 'silence': 
-                i += 1
-                continue
+        self._prerender_job = self.root.after_idle(step)
 
-            if w_obj.get('is_inaudible') and not show_inaudible:
-                i += 1
-                continue
-
-            if w_obj.get('is_segment_start'):
-                if self.text_area.index("end-1c") != "1.0":
-                    self.text_area.insert(tk.END, "\n\n")
-                
-                start_str = self.format_seconds(w_obj.get('seg_start', 0))
-                end_str = self.format_seconds(w_obj.get('seg_end', 0))
-                header_text = f"[{start_str}] - [{end_str}]"
-                tag_time = f"time_{w_obj['id']}"
-                
-                self.text_area.insert(tk.END, header_text, ("timestamp_style", tag_time))
-                self.text_area.insert(tk.END, "  ") 
-                
-                text_width = font_obj.measure(header_text + "  ")
-                sep_width = max(10, current_w - text_width - 20)
-                
-                sep_frame = tk.Frame(self.text_area, bg=config.NOTE_COL, height=1, width=sep_width)
-                self.text_area.window_create(tk.END, window=sep_frame, align="baseline")
-                self.separator_frames.append(sep_frame)
-                self.text_area.insert(tk.END, "\n")
-                
-                self.text_area.tag_bind(tag_time, "<Button-1>", lambda e, t=w_obj.get('seg_start', 0): self.resolve_handler.jump_to_seconds(t))
-                self.text_area.tag_bind(tag_time, "<Enter>", lambda e: self.text_area.config(cursor="hand2"))
-                self.text_area.tag_bind(tag_time, "<Leave>", lambda e: self.text_area.config(cursor="arrow"))
+    def _cancel_prerender(self):
+        if self._prerender_job:
+            try: self.root.after_cancel(self._prerender_job)
+            except: pass
+            self._prerender_job = None
+        self._back_page = None
 
-            if w_obj.get('is_inaudible'):
-                k = i + 1
-                count_to_skip = 1 
-                
-                while k < batch_len:
-                    next_w = current_batch_words[k]
-                    if next_w.get('type') == 'silence':
-                        k += 1
-                        count_to_skip += 1
-                    elif next_w.get('is_inaudible'):
-                        k += 1
-                        count_to_skip += 1
-                    else:
-                        break
-                
-                tag_name = f"w_{w_obj['id']}"
-                state = w_obj.get('status')
-                display_text = self.txt("lbl_inaudible_tag")
-                
-                if w_obj.get('selected') and not state: 
-                     state = "inaudible"
-                
-                state_tag = state if state else "normal"
-                self.text_area.insert(tk.END, display_text, (tag_name, "normal", state_tag))
-                
-                if state:
-                    self.text_area.tag_add(state, f"{tag_name}.first", f"{tag_name}.last")
-                
-                space_tag = "normal"
-                if k < batch_len:
-                    real_next_w = current_batch_words[k]
-                    next_state = real_next_w.get('status')
-                    if real_next_w.get('selected') and not next_state: 
-                        if real_next_w.get('is_inaudible'): next_state = "inaudible"
-                        else: next_state = "bad"
-                    if state and next_state: space_tag = state_tag 
-                
-                self.text_area.insert(tk.END, " ", (tag_name, "normal", space_tag))
-                
-                i += count_to_skip
-                continue 
+    def _begin_render(self, widget, separators):
+        """Clears a transcript widget and returns the per-render context."""
+        widget.configure(state="normal")
+        
+        # Harvest separator frames for reuse: handing a frame to another geometry
+        # manager detaches it from the text, so deleting the text won't destroy it.
+        sep_pool = self._sep_pools.setdefault(str(widget), [])
+        for frame in separators:
+            try:
+                frame.place(x=-10, y=-10)
+                frame.place_forget()
+                sep_pool.append(frame)
+            except tk.TclError:
+                pass
+        separators.clear()
+        
+        # Status tags currently carried by each rendered word, keyed by word id
+        word_tags = self._word_tags.setdefault(str(widget), {})
+        word_tags.clear()
+        
+        widget.delete("1.0", tk.END)
+        return {
+            "word_tags": word_tags,
+            "current_w": self._text_w,
+            "font_key": widget.cget("font"),
+            "separators": separators,
+            "sep_pool": sep_pool,
+            "has_content": False,
+        }
 
-            else:
-                tag_name = f"w_{w_obj['id']}"
-                state = w_obj.get('status', None)
+    def _render_words(self, widget, plan, i, stop, ctx):
+        """
+        Renders plan[i:stop] (see algorythms.build_render_plan) at the end of
+        the widget and returns stop.
+        The whole range is emitted as one Tcl script: runs of (text, tags) pairs
+        become a single "insert" command, broken only by separator "window create"
+        commands, and the script is evaluated with one tk.eval.
+        """
+        current_w = ctx["current_w"]
+        font_key = ctx["font_key"]
+        
+        # Loop invariants bound to locals (saves attribute lookups per word)
+        inaudible_label = self.txt("lbl_inaudible_tag")
+        fmt = self.format_seconds
+        path = str(widget)
+        quote = _tcl_arg
+        
+        header_fmt = self.HEADER_FMT
+        seg_starts = self._seg_starts
+        sep_pool = ctx["sep_pool"]
+        word_tags = ctx["word_tags"]
+        rendered_tags = self.RENDERED_STATUS_TAGS
+        
+        script = []
+        chunks = []
+        emit = chunks.extend
+        
+        def flush():
+            if chunks:
+                script.append(f"{path} insert end {' '.join(map(quote, chunks))}")
+                chunks.clear()
+        
+        for j in range(i, stop):
+            w_obj = plan[j]
+
+            if w_obj.is_segment_start:
+                if ctx["has_content"]:
+                    emit(("\n\n", ()))
                 
-                if w_obj.get('selected') and not state: 
-                     state = "bad"
-                     w_obj['status'] = "bad"
+                header_line = header_fmt.format(fmt(w_obj.seg_start), fmt(w_obj.seg_end))
+                tag_time = f"time_{w_obj.id}"
                 
-                state_tag = state if state else "normal"
-                self.text_area.insert(tk.END, w_obj['text'], (tag_name, "normal", state_tag))
+                emit((header_line[:-2], ("timestamp_style", tag_time), "  ", ()))
                 
-                if state:
-                    self.text_area.tag_add(state, f"{tag_name}.first", f"{tag_name}.last")
+                text_width = _measure(font_key, header_line)
+                sep_width = max(10, current_w - text_width - 20)
                 
-                space_tag = "normal"
-                if state: 
-                    if i + 1 < batch_len:
-                        next_idx = i + 1
-                        while next_idx < batch_len and current_batch_words[next_idx].get('type') == 'silence':
-                            next_idx += 1
-                        while next_idx < batch_len and current_batch_words[next_idx].get('is_inaudible') and not show_inaudible:
-                            next_idx += 1
-                        
-                        if next_idx < batch_len:
-                            next_w = current_batch_words[next_idx]
-                            next_state = next_w.get('status')
-                            if next_w.get('selected') and not next_state: 
-                                if next_w.get('is_inaudible'): next_state = "inaudible"
-                                else: next_state = "bad"
-                            if next_state: space_tag = state_tag 
+                flush()
+                sep_frame = None
+                while sep_pool and sep_frame is None:
+                    sep_frame = sep_pool.pop()
+                    if not sep_frame.winfo_exists(): sep_frame = None
+                if sep_frame is None:
+                    sep_frame = tk.Frame(widget, bg=config.NOTE_COL, height=1, width=sep_width)
+                else:
+                    sep_frame.config(width=sep_width)
+                script.append(f"{path} window create end -window {sep_frame} -align baseline")
+                ctx["separators"].append(sep_frame)
+                emit(("\n", ()))
                 
-                self.text_area.insert(tk.END, " ", (tag_name, "normal", space_tag))
-                i += 1
+                seg_starts[w_obj.id] = w_obj.seg_start
+                ctx["has_content"] = True
 
-        self.setup_bindings()
-        self.text_area.configure(state="disabled")
-        
-        self.text_area.update_idletasks()
-        
-        if current_y_view:
-            self.text_area.yview_moveto(current_y_view[0])
+            wid = w_obj.id
+            tag_name = f"w_{wid}"
+            display_text = inaudible_label if w_obj.is_inaudible else w_obj.text
             
-        self.on_text_resize(None)
-        self.text_area.bind("<Configure>", self.on_text_resize)
+            # Effective states are precomputed (algorythms.refresh_render_states)
+            state_tag = w_obj.state or "normal"
+            space_tag = state_tag if w_obj.state_next else "normal"
+            
+            emit((display_text, (tag_name, "normal", state_tag), " ", (tag_name, "normal", space_tag)))
+            word_tags[wid] = rendered_tags.get(state_tag) or ("normal", state_tag)
+            ctx["has_content"] = True
+
+        flush()
+        if script:
+            widget.tk.eval("\n".join(script))
+        return stop
 
     def on_text_resize(self, event):
+        """
+        Debounced separator resize. A programmatic call (event None) means the frames
+        were just rebuilt, so the width cache is dropped. While <Configure> events keep
+        arriving (window drag) the delay is stretched to coalesce the burst.
+        """
+        delay = 50
+        if event is None:
+            self._last_sep_width = None
+        elif event.widget is self.text_area:
+            self._text_w = event.width
         if self.resize_timer:
             self.root.after_cancel(self.resize_timer)
-        self.resize_timer = self.root.after(50, lambda: self._perform_resize_update(self.text_area.winfo_width()))
+            if event is not None: delay = 100
+        self.resize_timer = self.root.after(delay, lambda: self._perform_resize_update(self._text_w))
 
     def _perform_resize_update(self, width):
+        self.resize_timer = None
         if width > 1:
             new_w = width - 180 
             
             if new_w < 10: new_w = 10
+            if new_w == self._last_sep_width: return
+            self._last_sep_width = new_w
             for frame in self.separator_frames:
                 try: frame.config(width=new_w)
                 except: pass
 
-    def setup_bindings(self):
-        self.text_area.bind("<Button-1>", lambda e: (self.close_menu_if_open(), self.on_click_start(e)))
-        self.text_area.bind("<B1-Motion>", self.on_drag)
-        self.text_area.bind("<ButtonRelease-1>", self.on_click_end)
+    def setup_bindings(self, text_area):
+        text_area.bind("<Button-1>", lambda e: (self.close_menu_if_open(), self.on_click_start(e)))
+        text_area.bind("<B1-Motion>", self.on_drag)
+        text_area.bind("<ButtonRelease-1>", self.on_click_end)
+        # Every segment header carries "timestamp_style": one pair of tag bindings
+        # per widget covers all timestamps
+        text_area.tag_bind("timestamp_style", "<Enter>", self._on_time_enter)
+        text_area.tag_bind("timestamp_style", "<Leave>", self._on_time_leave)
+
+    def _time_tag_at_index(self, text_area, index):
+        for t in text_area.tag_names(index):
+            if t.startswith("time_"): return t
+        return None
+
+    def _on_time_enter(self, event):
+        event.widget.config(cursor="hand2")
+
+    def _on_time_leave(self, event):
+        event.widget.config(cursor="arrow")
 
     def get_word_id_at_index(self, index):
         tags = self.text_area.tag_names(index)
@@ -1912,9 +2178,13 @@ class BadWordsGUI:
 
     def on_click_start(self, event):
         index = self.text_area.index(f"@{event.x},{event.y}")
-        tags = self.text_area.tag_names(index)
-        for t in tags:
-            if t.startswith("time_"): return "break" 
+        tag_time = self._time_tag_at_index(self.text_area, index)
+        if tag_time:
+            # Timestamp clicks are dispatched here instead of per-segment tag bindings
+            seg_start = self._seg_starts.get(int(tag_time.split("_")[1]))
+            if seg_start is not None:
+                self.resolve_handler.jump_to_seconds(seg_start)
+            return "break" 
 
         wid = self.get_word_id_at_index(index)
         if (event.state & 0x4) != 0 and wid is not None: 
@@ -1934,13 +2204,27 @@ class BadWordsGUI:
         index = self.text_area.index(f"@{event.x},{event.y}")
         wid = self.get_word_id_at_index(index)
         if wid is not None and wid != self.last_dragged_id:
-            current_tool = self.var_mark_tool.get()
-            new_status = None if current_tool == "eraser" else current_tool
-            self.update_word_status(wid, new_status)
+            # Motion events arrive per pixel: collect the swept words and mark them
+            # in one batch per frame (~16 ms)
+            self._drag_pending[wid] = None
+            if self._drag_timer is None:
+                self._drag_timer = self.root.after(16, self._flush_drag)
             self.last_dragged_id = wid
         return "break"
 
+    def _flush_drag(self):
+        self._drag_timer = None
+        if not self._drag_pending: return
+        current_tool = self.var_mark_tool.get()
+        new_status = None if current_tool == "eraser" else current_tool
+        updates = algorythms.propagate_status_changes(self.words_data, list(self._drag_pending), new_status)
+        self._drag_pending.clear()
+        self._apply_status_updates(updates)
+
     def on_click_end(self, event):
+        if self._drag_timer is not None:
+            self.root.after_cancel(self._drag_timer)
+        self._flush_drag()
         self.is_dragging = False
         self.last_dragged_id = -1
         return "break"
@@ -1948,22 +2232,125 @@ class BadWordsGUI:
     def update_word_status(self, word_id, status):
         # Delegated to algorithms
         updates = algorythms.propagate_status_change(self.words_data, word_id, status)
-        
+        self._apply_status_updates(updates)
+
+    def _status_snapshot(self):
+        """Marking state of every word, taken before an analysis mutates words_data."""
+        return {w['id']: (w.get('status'), bool(w.get('selected'))) for w in self.words_data}
+
+    def _apply_status_diff(self, before):
+        """
+        Retags the words whose marking changed since `before` (see _status_snapshot).
+        The analyses only touch status/selected, so no rebuild is needed; trailing
+        spaces are then retagged so the page looks as a rebuild would.
+        """
+        updates = []
+        for w in self.words_data:
+            status = w.get('status')
+            selected = bool(w.get('selected'))
+            if before.get(w['id']) == (status, selected): continue
+            if not status and selected:
+                if w.get('is_inaudible'):
+                    status = "inaudible"
+                else:
+                    status = "bad"
+                    w['status'] = "bad"
+            updates.append((w['id'], status))
+        self._apply_status_updates(updates)
+        if updates:
+            self._retag_trailing_spaces({wid for wid, _ in updates})
+
+    def _retag_trailing_spaces(self, changed):
+        """
+        A retag colors a word's whole w_<id> span, trailing space included. A
+        rendered space only carries the word's state when the next word has one
+        too (RenderToken.state_next), so the spaces of the changed words and of
+        the words right before them are set again from the refreshed plans.
+        """
+        buffers = [(self.text_area, self._get_page_plan(self.current_page))]
+        if self._back_page is not None:
+            buffers.append((self._text_area_back, self._get_page_plan(self._back_page)))
+        elif self._prerender_job:
+            buffers.append((self._text_area_back, self._prerender_plan))
+        
+        for text_area, plan in buffers:
+            word_tags = self._word_tags.get(str(text_area))
+            if not word_tags: continue
+            
+            remove_ranges = {}
+            add_ranges = {}
+            for j, tok in enumerate(plan):
+                if tok.id not in changed and (j + 1 >= len(plan) or plan[j + 1].id not in changed): continue
+                present = word_tags.get(tok.id)
+                if present is None: continue  # not rendered (yet) in this buffer
+                span = (f"w_{tok.id}.last - 1 chars", f"w_{tok.id}.last")
+                for s in present:
+                    remove_ranges.setdefault(s, []).extend(span)
+                if tok.state and tok.state_next:
+                    add_ranges.setdefault(tok.state, []).extend(span)
+            
+            if not remove_ranges and not add_ranges: continue
+            text_area.configure(state="normal")
+            for s, pairs in remove_ranges.items():
+                self._retag_ranges(text_area, "remove", s, pairs)
+            for s, pairs in add_ranges.items():
+                self._retag_ranges(text_area, "add", s, pairs)
+            text_area.configure(state="disabled")
+
+    def _apply_status_updates(self, updates):
+        """Retags already rendered words; updates is a list of (word_id, status)."""
         if not updates: return
-
-        self.text_area.configure(state="normal")
         
-        def apply_tag_to_word(w_id, new_stat):
-            tag_name = f"w_{w_id}"
-            for s in ["bad", "repeat", "typo", "inaudible", "normal"]:
-                try: self.text_area.tag_remove(s, f"{tag_name}.first", f"{tag_name}.last")
-                except: pass
+        # Tokens still waiting to be rendered pick up the new states from words_data
+        if self._render_ctx:
+            algorythms.refresh_render_states(self._render_ctx["plan"], self._render_ctx["next"])
+        if self._prerender_job:
+            algorythms.refresh_render_states(self._prerender_plan)
+        self._stale_plans.update(self._plan_cache)
+
+        # Both buffers: the pre-rendered page stays valid across marking
+        for text_area in (self.text_area, self._text_area_back):
+            word_tags = self._word_tags.get(str(text_area))
+            if not word_tags: continue
             
-            if new_stat and new_stat != "normal":
-                try: self.text_area.tag_add(new_stat, f"{tag_name}.first", f"{tag_name}.last")
-                except: pass
-
-        for wid, stat in updates:
-            apply_tag_to_word(wid, stat)
+            # Group index pairs per tag: Tk's "tag remove/add" accept many ranges,
+            # so each tag costs one Tcl call however many words change.
+            remove_ranges = {}
+            add_ranges = {}
+            for wid, stat in updates:
+                present = word_tags.get(wid)
+                if present is None: continue  # not rendered in this buffer
+                span = (f"w_{wid}.first", f"w_{wid}.last")
+                for s in present:
+                    remove_ranges.setdefault(s, []).extend(span)
+                if stat and stat != "normal":
+                    add_ranges.setdefault(stat, []).extend(span)
+                    word_tags[wid] = (stat,)
+                else:
+                    word_tags[wid] = ()
             
-        self.text_area.configure(state="disabled")
\ No newline at end of file
+            if not remove_ranges and not add_ranges: continue
+            text_area.configure(state="normal")
+            for s, pairs in remove_ranges.items():
+                self._retag_ranges(text_area, "remove", s, pairs)
+            for s, pairs in add_ranges.items():
+                self._retag_ranges(text_area, "add", s, pairs)
+            text_area.configure(state="disabled")
+
+    def _retag_ranges(self, text_area, op, tag, pairs):
+        """
+        "tag add/remove" over many index pairs in one call. If a range is stale
+        (its w_<id> tag is gone) the batch fails as a whole, so it is retried pair
+        by pair and only the stale words are skipped.
+        """
+        path = str(text_area)
+        try:
+            text_area.tk.call(path, "tag", op, tag, *pairs)
+            return
+        except tk.TclError as e:
+            log_error(f"Batched tag {op} '{tag}' failed, retrying per word: {e}")
+        for k in range(0, len(pairs), 2):
+            try:
+                text_area.tk.call(path, "tag", op, tag, pairs[k], pairs[k + 1])
+            except tk.TclError:
+                pass
\ No newline at end of file
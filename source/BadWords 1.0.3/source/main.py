@@ -38,6 +38,11 @@ def init_system_thread(os_doc, result_queue):
         # 2. Initialize Engine (Processing Logic Layer) - Checks FFmpeg/Whisper
         audio_engine = engine.AudioEngine(os_doc, resolve)
         
+        # Record missing tools in the log (locates Whisper without importing it)
+        missing = os_doc.check_dependencies()
+        if missing:
+            osdoc.log_error(f"Missing dependencies: {', '.join(missing)}")
+        
         # Put results in queue
         result_queue.put((resolve, audio_engine))
     except Exception as e:
@@ -105,6 +110,7 @@ def main():
             # Cleanup operations before exit
             if os_doc:
                 os_doc.cleanup_temp()
+                os_doc._close_log_listener()
             root.destroy()
             sys.exit(0) # Ensure process kills threads
             
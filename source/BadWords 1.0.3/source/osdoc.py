@@ -19,32 +19,82 @@ import sys
 import platform
 import shutil
 import logging
+import logging.handlers
+import atexit
 import subprocess
 import tempfile
+import importlib.util
+import queue
 import datetime
+import threading
+from functools import lru_cache
 
 # ==========================================
 # 1. LOGGING & STREAM PROXY
 # ==========================================
 
+def _last_state(text):
+    """Last non-blank carriage-return segment: what a progress bar line finally shows."""
+    for part in reversed(text.split("\r")):
+        if part.strip(): return part
+    return ""
+
 class ResolveStreamProxy:
     """
     Captures stdout/stderr streams so error messages
     go both to the DaVinci console and the log file.
+    
+    Writes are coalesced into whole lines before logging: print() fragments form
+    one record, and carriage-return updates (tqdm progress bars) collapse to the
+    line's last state. A partial line is logged on flush() or at exit.
+    Nothing is assembled while the root logger would drop log_func's level.
     """
-    def __init__(self, stream, log_func):
+    def __init__(self, stream, log_func, level=logging.INFO):
         self.stream = stream
         self.log_func = log_func
+        self.level = level  # level log_func logs at
+        self._pending = ""  # text after the last newline, not logged yet
+        self._lock = threading.Lock()
+        
+        # Attributes libraries commonly probe (encoding, isatty, ...) are bound
+        # up front, so only the rare ones go through __getattr__
+        for attr in ('fileno', 'encoding', 'errors', 'isatty', 'buffer', 'writable', 'readable', 'close'):
+            try:
+                setattr(self, attr, getattr(stream, attr))
+            except AttributeError:
+                pass
     
     def write(self, data):
         try:
-            if data.strip(): 
-                self.log_func(f"[STDOUT/ERR] {data.strip()}")
             self.stream.write(data)
         except: 
             pass 
+        try:
+            if not data or not logging.root.isEnabledFor(self.level):
+                return
+            with self._lock:
+                *lines, self._pending = (self._pending + data).split("\n")
+                if "\r" in self._pending:
+                    self._pending = _last_state(self._pending)
+            for line in lines:
+                line = _last_state(line).strip()
+                if line:
+                    self.log_func(f"[STDOUT/ERR] {line}")
+        except: 
+            pass 
+    
+    def flush_pending(self):
+        """Logs the current partial line, if any."""
+        try:
+            with self._lock:
+                line, self._pending = self._pending.strip(), ""
+            if line:
+                self.log_func(f"[STDOUT/ERR] {line}")
+        except: 
+            pass 
     
     def flush(self):
+        self.flush_pending()
         try:
             if hasattr(self.stream, 'flush'): 
                 self.stream.flush()
@@ -72,6 +122,34 @@ def log_error(msg):
 # 2. OS DOCTOR CLASS
 # ==========================================
 
+@lru_cache(maxsize=1)
+def _locate_ffmpeg(is_win, is_linux, home):
+    """
+    Resolves the FFmpeg command (see OSDoctor.get_ffmpeg_cmd).
+    The lookup stats several paths and walks PATH, so its result is cached;
+    call _locate_ffmpeg.cache_clear() to look again.
+    """
+    # 1. Check local directory (common for portable builds)
+    local_ffmpeg_win = "ffmpeg.exe"
+    if is_win and os.path.exists(local_ffmpeg_win):
+        return os.path.abspath(local_ffmpeg_win)
+        
+    local_ffmpeg_nix = "./ffmpeg"
+    if not is_win and os.path.exists(local_ffmpeg_nix):
+        return os.path.abspath(local_ffmpeg_nix)
+
+    # 2. Linux specific user bin check
+    if is_linux:
+        local_bin = os.path.join(home, ".local", "bin", "ffmpeg")
+        if os.path.exists(local_bin):
+            return local_bin
+            
+    # 3. System PATH fallback
+    if shutil.which("ffmpeg"):
+        return "ffmpeg"
+        
+    return None
+
 class OSDoctor:
     def __init__(self):
         """
@@ -95,6 +173,13 @@ class OSDoctor:
         
         self.saves_dir = os.path.join(self.app_data_dir, "saves")
         
+        # Set once the folder is known to exist, so the getters skip makedirs
+        self._temp_ready = False
+        self._saves_ready = False
+        
+        # Reusable STARTUPINFO for hidden console windows (see get_startup_info)
+        self._startup_info = None
+        
         # Initialize logging subsystem
         self._setup_logging()
         
@@ -120,10 +205,12 @@ class OSDoctor:
         
         try:
             os.makedirs(path, exist_ok=True)
-            # Test write permission
-            test_file = os.path.join(path, ".test_write")
-            with open(test_file, 'w') as f: f.write('ok')
-            os.remove(test_file)
+            # Test write permission. On Windows os.access only sees the read-only
+            # attribute, not ACLs, so a real probe file is needed there.
+            if self.is_win:
+                with tempfile.TemporaryFile(dir=path): pass
+            elif not os.access(path, os.W_OK):
+                raise PermissionError(f"No write access to {path}")
             return path
         except Exception as e:
             # Fallback to TEMP folder if main config fails
@@ -146,18 +233,23 @@ class OSDoctor:
         if self.is_linux:
             home = os.path.expanduser("~")
             
+            # One directory listing of home instead of a stat per candidate
+            subdirs = set()
+            try:
+                with os.scandir(home) as it:
+                    subdirs = {e.name for e in it if e.name in ("Videos", "Documents") and e.is_dir()}
+            except OSError:
+                pass
+            
             # Priority 1: ~/Videos/BadWords_Temp (Standard media location)
-            videos = os.path.join(home, "Videos")
-            if os.path.exists(videos):
-                path = os.path.join(videos, "BadWords_Temp")
+            if "Videos" in subdirs:
+                path = os.path.join(home, "Videos", "BadWords_Temp")
+            # Priority 2: ~/Documents/BadWords_Temp
+            elif "Documents" in subdirs:
+                path = os.path.join(home, "Documents", "BadWords_Temp")
             else:
-                # Priority 2: ~/Documents/BadWords_Temp
-                documents = os.path.join(home, "Documents")
-                if os.path.exists(documents):
-                    path = os.path.join(documents, "BadWords_Temp")
-                else:
-                    # Priority 3: ~/BadWords_Temp (Visible in Home)
-                    path = os.path.join(home, "BadWords_Temp")
+                # Priority 3: ~/BadWords_Temp (Visible in Home)
+                path = os.path.join(home, "BadWords_Temp")
             
             try:
                 os.makedirs(path, exist_ok=True)
@@ -171,34 +263,70 @@ class OSDoctor:
 
     def _setup_logging(self):
         """Configures logging to file and stream redirection."""
-        # Reset logging handlers if re-initialized
+        # Reset logging handlers if re-initialized: the old proxies' partial lines
+        # and the old listener's queue are written out before they are replaced
+        if getattr(self, "_proxies", None):
+            self._flush_proxies()
+        self._close_log_listener()
         for handler in logging.root.handlers[:]:
             logging.root.removeHandler(handler)
+            handler.close()
         
         try:
-            logging.basicConfig(
-                filename=self.log_file,
-                level=logging.INFO,
-                format='%(asctime)s [%(levelname)s] %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
+            file_handler = logging.FileHandler(self.log_file)
+            file_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S'))
+            
+            # The calling thread (often Resolve's UI thread) only enqueues records;
+            # a listener thread does the file writes, so each record still reaches
+            # the log as it happens (nothing is lost if Resolve hangs or is killed)
+            log_queue = queue.Queue(-1)
+            listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+            logging.root.addHandler(logging.handlers.QueueHandler(log_queue))
+            logging.root.setLevel(logging.INFO)
+            listener.start()
+            self._log_listener = listener
         except PermissionError:
              print(f"CRITICAL: Cannot write to log file {self.log_file}. Logging disabled.")
              logging.basicConfig(level=logging.INFO)
         
         # Redirect stdout/stderr to capture internal errors
         sys.stdout = ResolveStreamProxy(sys.__stdout__, logging.info)
-        sys.stderr = ResolveStreamProxy(sys.__stderr__, logging.error)
+        sys.stderr = ResolveStreamProxy(sys.__stderr__, logging.error, logging.ERROR)
+        self._proxies = (sys.stdout, sys.stderr)
+        
+        if not getattr(self, "_exit_hook", False):
+            atexit.register(self._shutdown_logging)
+            self._exit_hook = True
+
+    def _close_log_listener(self):
+        """Stops the log listener thread (draining its queue) and flushes its handlers."""
+        listener = getattr(self, "_log_listener", None)
+        if not listener: return
+        self._log_listener = None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+    def _shutdown_logging(self):
+        """Exit hook: logs the proxies' partial lines, then drains the listener."""
+        self._flush_proxies()
+        self._close_log_listener()
+
+    def _flush_proxies(self):
+        for proxy in self._proxies:
+            proxy.flush_pending()
 
     def _log_system_info(self):
-        """Logs detailed system information for debugging."""
-        log_info("="*30)
-        log_info(f"BadWords Session Started")
-        log_info(f"OS: {self.os_type} {platform.release()} ({platform.version()})")
-        log_info(f"Python: {sys.version}")
-        log_info(f"App Data Dir: {self.app_data_dir}")
-        log_info(f"Temp/Render Dir: {self.temp_dir}") # Log this to verify fix
-        log_info("="*30)
+        """Logs detailed system information for debugging (as one multi-line record)."""
+        log_info("\n".join([
+            "="*30,
+            "BadWords Session Started",
+            f"OS: {self.os_type} {platform.release()} ({platform.version()})",
+            f"Python: {sys.version}",
+            f"App Data Dir: {self.app_data_dir}",
+            f"Temp/Render Dir: {self.temp_dir}", # Log this to verify fix
+            "="*30,
+        ]))
 
     # ==========================
     # PATHS & RESOLVE API
@@ -224,26 +352,7 @@ class OSDoctor:
         Returns OS-specific FFmpeg command suggestion.
         Prioritizes local binaries for portable installs.
         """
-        # 1. Check local directory (common for portable builds)
-        local_ffmpeg_win = "ffmpeg.exe"
-        if self.is_win and os.path.exists(local_ffmpeg_win):
-            return os.path.abspath(local_ffmpeg_win)
-            
-        local_ffmpeg_nix = "./ffmpeg"
-        if not self.is_win and os.path.exists(local_ffmpeg_nix):
-            return os.path.abspath(local_ffmpeg_nix)
-
-        # 2. Linux specific user bin check
-        if self.is_linux:
-            local_bin = os.path.expanduser("~/.local/bin/ffmpeg")
-            if os.path.exists(local_bin):
-                return local_bin
-                
-        # 3. System PATH fallback
-        if shutil.which("ffmpeg"):
-            return "ffmpeg"
-            
-        return None
+        return _locate_ffmpeg(self.is_win, self.is_linux, self.home_dir)
 
     def get_startup_info(self):
         """
@@ -251,9 +360,16 @@ class OSDoctor:
         to hide popup console windows (FFmpeg/Whisper).
         """
         if self.is_win:
+            if self._startup_info is not None:
+                return self._startup_info
             si = subprocess.STARTUPINFO()
             si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
             si.wShowWindow = subprocess.SW_HIDE
+            # Popen works on its own copy of startupinfo since Python 3.7
+            # (STARTUPINFO.copy exists from then on); older versions modify the
+            # object passed in, so there it is built fresh for every call
+            if hasattr(si, "copy"):
+                self._startup_info = si
             return si
         return None
 
@@ -263,29 +379,43 @@ class OSDoctor:
 
     def get_temp_folder(self):
         """Returns path to the temporary folder, creating it if needed."""
-        try:
-            os.makedirs(self.temp_dir, exist_ok=True)
-        except Exception as e:
-            log_error(f"Failed to create temp dir: {e}")
+        if not self._temp_ready:
+            try:
+                os.makedirs(self.temp_dir, exist_ok=True)
+                self._temp_ready = True
+            except Exception as e:
+                log_error(f"Failed to create temp dir: {e}")
         return self.temp_dir
         
     def get_saves_folder(self):
         """Returns path to the saves folder, creating it if needed."""
-        try:
-            os.makedirs(self.saves_dir, exist_ok=True)
-        except Exception as e:
-            log_error(f"Failed to create saves dir: {e}")
+        if not self._saves_ready:
+            try:
+                os.makedirs(self.saves_dir, exist_ok=True)
+                self._saves_ready = True
+            except Exception as e:
+                log_error(f"Failed to create saves dir: {e}")
         return self.saves_dir
 
     def cleanup_temp(self):
-        """Removes the temporary directory and its contents."""
+        """
+        Removes the contents of the temporary directory.
+        The directory itself is kept, so it doesn't need re-creating for next use.
+        A file that can't be removed (e.g. still open in Resolve) is skipped.
+        """
+        if not os.path.isdir(self.temp_dir): return
         log_info(f"Cleaning temporary files in: {self.temp_dir}")
         try:
-            if os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir)
-                # Re-create empty dir for next use
-                os.makedirs(self.temp_dir, exist_ok=True)
-        except Exception as e:
+            with os.scandir(self.temp_dir) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.unlink(entry.path)
+                    except OSError as e:
+                        log_error(f"Cleanup Error: {e}")
+        except OSError as e:
             log_error(f"Cleanup Error: {e}")
 
     # ==========================
@@ -315,16 +445,16 @@ class OSDoctor:
             whisper_found = True
             
         # 2. Fallback: Check for Python Module (Supports Windows legacy / portable envs)
+        # Only locates the module; importing it would pull in torch (seconds)
         if not whisper_found:
             try:
-                import whisper # type: ignore
-                whisper_found = True
-            except ImportError:
+                whisper_found = importlib.util.find_spec("whisper") is not None
+            except (ImportError, ValueError):
                 pass
         
         if not whisper_found:
             missing.append("openai-whisper (command or module)")
-            
+        
         return missing
 
     # ==========================